@@ -3,7 +3,10 @@
 
 import os
 import yaml
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def replace_env_vars(value: str) -> str:
@@ -31,24 +34,31 @@ def process_dict(config: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-_config_cache: Dict[str, Dict[str, Any]] = {}
+_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 def load_yaml_config(file_path: str) -> Dict[str, Any]:
-    """Load and process YAML configuration file."""
+    """Load and process YAML configuration file.
+
+    Results are cached per path and reloaded when the file's mtime or size changes.
+    """
     # 如果文件不存在，返回{}
-    if not os.path.exists(file_path):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         return {}
+    file_signature = (stat.st_mtime_ns, stat.st_size)
 
-    # 检查缓存中是否已存在配置
-    if file_path in _config_cache:
-        return _config_cache[file_path]
+    # 检查缓存中是否已存在配置，且文件未被修改
+    cached = _config_cache.get(file_path)
+    if cached is not None and cached[0] == file_signature:
+        return cached[1]
 
-    # 如果缓存中不存在，则加载并处理配置
+    # 如果缓存中不存在或已过期，则加载并处理配置
     with open(file_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlSafeLoader)
     processed_config = process_dict(config)
 
     # 将处理后的配置存入缓存
-    _config_cache[file_path] = processed_config
+    _config_cache[file_path] = (file_signature, processed_config)
     return processed_config
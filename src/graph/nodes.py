@@ -3,7 +3,6 @@
 
 import json
 import logging
-import os
 from typing import Annotated, Literal
 
 from langchain_core.messages import AIMessage, HumanMessage
@@ -22,7 +21,7 @@ from src.tools import (
 )
 
 from src.config.agents import AGENT_LLM_MAP
-from src.config.configuration import Configuration
+from src.config.configuration import Configuration, get_recursion_limit
 from src.llms.llm import get_llm_by_type
 from src.prompts.planner_model import Plan
 from src.prompts.template import apply_prompt_template
@@ -123,8 +122,8 @@ def planner_node(
         response = llm.stream(messages)
         for chunk in response:
             full_response += chunk.content
-    logger.debug(f"Current state messages: {state['messages']}")
-    logger.info(f"Planner response: {full_response}")
+    logger.debug("Current state messages: %s", state["messages"])
+    logger.info("Planner response: %s", full_response)
 
     try:
         curr_plan = json.loads(repair_json_output(full_response))
@@ -162,8 +161,10 @@ def human_feedback_node(
     if not auto_accepted_plan:
         feedback = interrupt("Please Review the Plan.")
 
+        normalized_feedback = str(feedback).upper() if feedback else ""
+
         # if the feedback is not accepted, return the planner node
-        if feedback and str(feedback).upper().startswith("[EDIT_PLAN]"):
+        if normalized_feedback.startswith("[EDIT_PLAN]"):
             return Command(
                 update={
                     "messages": [
@@ -172,7 +173,7 @@ def human_feedback_node(
                 },
                 goto="planner",
             )
-        elif feedback and str(feedback).upper().startswith("[ACCEPTED]"):
+        elif normalized_feedback.startswith("[ACCEPTED]"):
             logger.info("Plan is accepted by user.")
         else:
             raise TypeError(f"Interrupt value of {feedback} is not supported.")
@@ -215,7 +216,7 @@ def coordinator_node(
         .bind_tools([handoff_to_planner])
         .invoke(messages)
     )
-    logger.debug(f"Current state messages: {state['messages']}")
+    logger.debug("Current state messages: %s", state["messages"])
 
     goto = "__end__"
     locale = state.get("locale", "en-US")  # Default locale if not specified
@@ -230,11 +231,10 @@ def coordinator_node(
             for tool_call in response.tool_calls:
                 if tool_call.get("name", "") != "handoff_to_planner":
                     continue
-                if tool_call.get("args", {}).get("locale") and tool_call.get(
-                    "args", {}
-                ).get("research_topic"):
-                    locale = tool_call.get("args", {}).get("locale")
-                    research_topic = tool_call.get("args", {}).get("research_topic")
+                tool_args = tool_call.get("args", {})
+                if tool_args.get("locale") and tool_args.get("research_topic"):
+                    locale = tool_args["locale"]
+                    research_topic = tool_args["research_topic"]
                     break
         except Exception as e:
             logger.error(f"Error processing tool calls: {e}")
@@ -242,7 +242,7 @@ def coordinator_node(
         logger.warning(
             "Coordinator response contains no tool calls. Terminating workflow execution."
         )
-        logger.debug(f"Coordinator response: {response}")
+        logger.debug("Coordinator response: %s", response)
     messages = state.get("messages", [])
     if response.content:
         messages.append(HumanMessage(content=response.content, name="coordinator"))
@@ -288,10 +288,10 @@ def reporter_node(state: State, config: RunnableConfig):
                 name="observation",
             )
         )
-    logger.debug(f"Current invoke messages: {invoke_messages}")
+    logger.debug("Current invoke messages: %s", invoke_messages)
     response = get_llm_by_type(AGENT_LLM_MAP["reporter"]).invoke(invoke_messages)
     response_content = response.content
-    logger.info(f"reporter response: {response_content}")
+    logger.info("reporter response: %s", response_content)
 
     return {"final_report": response_content}
 
@@ -329,10 +329,11 @@ async def _execute_agent_step(
     # Format completed steps information
     completed_steps_info = ""
     if completed_steps:
-        completed_steps_info = "# Completed Research Steps\n\n"
-        for i, step in enumerate(completed_steps):
-            completed_steps_info += f"## Completed Step {i + 1}: {step.title}\n\n"
-            completed_steps_info += f"<finding>\n{step.execution_res}\n</finding>\n\n"
+        completed_steps_info = "# Completed Research Steps\n\n" + "".join(
+            f"## Completed Step {i + 1}: {step.title}\n\n"
+            f"<finding>\n{step.execution_res}\n</finding>\n\n"
+            for i, step in enumerate(completed_steps)
+        )
 
     # Prepare the input for the agent with completed steps info
     agent_input = {
@@ -346,9 +347,13 @@ async def _execute_agent_step(
     # Add citation reminder for researcher agent
     if agent_name == "researcher":
         if state.get("resources"):
-            resources_info = "**The user mentioned the following resource files:**\n\n"
-            for resource in state.get("resources"):
-                resources_info += f"- {resource.title} ({resource.description})\n"
+            resources_info = (
+                "**The user mentioned the following resource files:**\n\n"
+                + "".join(
+                    f"- {resource.title} ({resource.description})\n"
+                    for resource in state.get("resources")
+                )
+            )
 
             agent_input["messages"].append(
                 HumanMessage(
@@ -366,36 +371,15 @@ async def _execute_agent_step(
         )
 
     # Invoke the agent
-    default_recursion_limit = 25
-    try:
-        env_value_str = os.getenv("AGENT_RECURSION_LIMIT", str(default_recursion_limit))
-        parsed_limit = int(env_value_str)
-
-        if parsed_limit > 0:
-            recursion_limit = parsed_limit
-            logger.info(f"Recursion limit set to: {recursion_limit}")
-        else:
-            logger.warning(
-                f"AGENT_RECURSION_LIMIT value '{env_value_str}' (parsed as {parsed_limit}) is not positive. "
-                f"Using default value {default_recursion_limit}."
-            )
-            recursion_limit = default_recursion_limit
-    except ValueError:
-        raw_env_value = os.getenv("AGENT_RECURSION_LIMIT")
-        logger.warning(
-            f"Invalid AGENT_RECURSION_LIMIT value: '{raw_env_value}'. "
-            f"Using default value {default_recursion_limit}."
-        )
-        recursion_limit = default_recursion_limit
-
-    logger.info(f"Agent input: {agent_input}")
+    recursion_limit = get_recursion_limit()
+    logger.info("Agent input: %s", agent_input)
     result = await agent.ainvoke(
         input=agent_input, config={"recursion_limit": recursion_limit}
     )
 
     # Process the result
     response_content = result["messages"][-1].content
-    logger.debug(f"{agent_name.capitalize()} full response: {response_content}")
+    logger.debug("%s full response: %s", agent_name.capitalize(), response_content)
 
     # Update the step with the execution result
     current_step.execution_res = response_content
@@ -485,7 +469,7 @@ async def researcher_node(
     retriever_tool = get_retriever_tool(state.get("resources", []))
     if retriever_tool:
         tools.insert(0, retriever_tool)
-    logger.info(f"Researcher tools: {tools}")
+    logger.info("Researcher tools: %s", tools)
     return await _setup_and_execute_agent_step(
         state,
         config,
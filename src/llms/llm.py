@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 import os
@@ -17,21 +18,23 @@ from src.llms.providers.dashscope import ChatDashscope
 
 # Cache for LLM instances
 _llm_cache: dict[LLMType, BaseChatModel] = {}
+# The conf.yaml contents the cached instances were created from
+_llm_cache_conf: Dict[str, Any] | None = None
 
 
+@lru_cache(maxsize=1)
 def _get_config_file_path() -> str:
-    """Get the path to the configuration file."""
+    """Get the path to the configuration file. Resolved once per process."""
     return str((Path(__file__).parent.parent.parent / "conf.yaml").resolve())
 
 
-def _get_llm_type_config_keys() -> dict[str, str]:
-    """Get mapping of LLM types to their configuration keys."""
-    return {
-        "reasoning": "REASONING_MODEL",
-        "basic": "BASIC_MODEL",
-        "vision": "VISION_MODEL",
-        "code": "CODE_MODEL",
-    }
+# Mapping of LLM types to their configuration keys
+_LLM_TYPE_CONFIG_KEYS: dict[str, str] = {
+    "reasoning": "REASONING_MODEL",
+    "basic": "BASIC_MODEL",
+    "vision": "VISION_MODEL",
+    "code": "CODE_MODEL",
+}
 
 
 def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
@@ -51,8 +54,7 @@ def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
 
 def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> BaseChatModel:
     """Create LLM instance using configuration."""
-    llm_type_config_keys = _get_llm_type_config_keys()
-    config_key = llm_type_config_keys.get(llm_type)
+    config_key = _LLM_TYPE_CONFIG_KEYS.get(llm_type)
 
     if not config_key:
         raise ValueError(f"Unknown LLM type: {llm_type}")
@@ -105,11 +107,19 @@ def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> BaseChatMod
 def get_llm_by_type(llm_type: LLMType) -> BaseChatModel:
     """
     Get LLM instance by type. Returns cached instance if available.
+
+    Cached instances are dropped when the contents of conf.yaml change.
     """
+    global _llm_cache_conf
+
+    conf = load_yaml_config(_get_config_file_path())
+    if conf is not _llm_cache_conf and conf != _llm_cache_conf:
+        _llm_cache.clear()
+        _llm_cache_conf = conf
+
     if llm_type in _llm_cache:
         return _llm_cache[llm_type]
 
-    conf = load_yaml_config(_get_config_file_path())
     llm = _create_llm_use_conf(llm_type, conf)
     _llm_cache[llm_type] = llm
     return llm
@@ -124,13 +134,12 @@ def get_configured_llm_models() -> dict[str, list[str]]:
     """
     try:
         conf = load_yaml_config(_get_config_file_path())
-        llm_type_config_keys = _get_llm_type_config_keys()
 
         configured_models: dict[str, list[str]] = {}
 
         for llm_type in get_args(LLMType):
             # Get configuration from YAML file
-            config_key = llm_type_config_keys.get(llm_type, "")
+            config_key = _LLM_TYPE_CONFIG_KEYS.get(llm_type, "")
             yaml_conf = conf.get(config_key, {}) if config_key else {}
 
             # Get configuration from environment variables
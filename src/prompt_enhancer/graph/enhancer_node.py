@@ -13,6 +13,20 @@ from src.prompt_enhancer.graph.state import PromptEnhancerState
 
 logger = logging.getLogger(__name__)
 
+_ENHANCED_PROMPT_PATTERN = re.compile(
+    r"<enhanced_prompt>(.*?)</enhanced_prompt>", re.DOTALL
+)
+
+# Common prefixes that might be added by the model in front of the prompt
+_PREFIXES_TO_REMOVE = (
+    "Enhanced Prompt:",
+    "Enhanced prompt:",
+    "Here's the enhanced prompt:",
+    "Here is the enhanced prompt:",
+    "**Enhanced Prompt**:",
+    "**Enhanced prompt**:",
+)
+
 
 def prompt_enhancer_node(state: PromptEnhancerState):
     """Node that enhances user prompts using AI analysis."""
@@ -47,9 +61,7 @@ def prompt_enhancer_node(state: PromptEnhancerState):
         logger.debug(f"Response content: {response_content}")
 
         # Try to extract content from XML tags first
-        xml_match = re.search(
-            r"<enhanced_prompt>(.*?)</enhanced_prompt>", response_content, re.DOTALL
-        )
+        xml_match = _ENHANCED_PROMPT_PATTERN.search(response_content)
 
         if xml_match:
             # Extract content from XML tags and clean it up
@@ -61,16 +73,7 @@ def prompt_enhancer_node(state: PromptEnhancerState):
             logger.warning("No XML tags found in response, using fallback parsing")
 
             # Remove common prefixes that might be added by the model
-            prefixes_to_remove = [
-                "Enhanced Prompt:",
-                "Enhanced prompt:",
-                "Here's the enhanced prompt:",
-                "Here is the enhanced prompt:",
-                "**Enhanced Prompt**:",
-                "**Enhanced prompt**:",
-            ]
-
-            for prefix in prefixes_to_remove:
+            for prefix in _PREFIXES_TO_REMOVE:
                 if enhanced_prompt.startswith(prefix):
                     enhanced_prompt = enhanced_prompt[len(prefix) :].strip()
                     break
@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import base64
 import json
 import logging
@@ -47,6 +48,10 @@ logger = logging.getLogger(__name__)
 
 INTERNAL_SERVER_ERROR_DETAIL = "Internal Server Error"
 
+# Shared encoder for SSE payloads; json.dumps builds a new encoder per call
+# whenever non-default options such as ensure_ascii=False are passed.
+_EVENT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 app = FastAPI(
     title="DeerFlow API",
     description="API for Deer",
@@ -222,7 +227,12 @@ async def _astream_workflow_generator(
 def _make_event(event_type: str, data: dict[str, any]):
     if data.get("content") == "":
         data.pop("content")
-    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return f"event: {event_type}\ndata: {_EVENT_JSON_ENCODER.encode(data)}\n\n"
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read()
 
 
 @app.post("/api/tts")
@@ -248,7 +258,8 @@ async def text_to_speech(request: TTSRequest):
             voice_type=voice_type,
         )
         # Call the TTS API
-        result = tts_client.text_to_speech(
+        result = await asyncio.to_thread(
+            tts_client.text_to_speech,
             text=request.text[:1024],
             encoding=request.encoding,
             speed_ratio=request.speed_ratio,
@@ -287,7 +298,9 @@ async def generate_podcast(request: GeneratePodcastRequest):
         report_content = request.content
         print(report_content)
         workflow = build_podcast_graph()
-        final_state = workflow.invoke({"input": report_content})
+        final_state = await asyncio.to_thread(
+            workflow.invoke, {"input": report_content}
+        )
         audio_bytes = final_state["output"]
         return Response(content=audio_bytes, media_type="audio/mp3")
     except Exception as e:
@@ -301,10 +314,11 @@ async def generate_ppt(request: GeneratePPTRequest):
         report_content = request.content
         print(report_content)
         workflow = build_ppt_graph()
-        final_state = workflow.invoke({"input": report_content})
+        final_state = await asyncio.to_thread(
+            workflow.invoke, {"input": report_content}
+        )
         generated_file_path = final_state["generated_file_path"]
-        with open(generated_file_path, "rb") as f:
-            ppt_bytes = f.read()
+        ppt_bytes = await asyncio.to_thread(_read_file_bytes, generated_file_path)
         return Response(
             content=ppt_bytes,
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
@@ -365,12 +379,13 @@ async def enhance_prompt(request: EnhancePromptRequest):
             report_style = ReportStyle.ACADEMIC
 
         workflow = build_prompt_enhancer_graph()
-        final_state = workflow.invoke(
+        final_state = await asyncio.to_thread(
+            workflow.invoke,
             {
                 "prompt": request.prompt,
                 "context": request.context,
                 "report_style": report_style,
-            }
+            },
         )
         return {"result": final_state["output"]}
     except Exception as e:
@@ -437,7 +452,8 @@ async def rag_resources(request: Annotated[RAGResourceRequest, Query()]):
     """Get the resources of the RAG."""
     retriever = build_retriever()
     if retriever:
-        return RAGResourcesResponse(resources=retriever.list_resources(request.query))
+        resources = await asyncio.to_thread(retriever.list_resources, request.query)
+        return RAGResourcesResponse(resources=resources)
     return RAGResourcesResponse(resources=[])
 
 
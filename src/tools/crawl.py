@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
 from typing import Annotated
 
 from langchain_core.tools import tool
@@ -11,6 +12,78 @@ from src.crawler import Crawler
 
 logger = logging.getLogger(__name__)
 
+_ALLOWED_URL_SCHEMES = frozenset({"http", "https"})
+
+
+class _InflightCrawl:
+    """Result of a crawl in progress, shared by all callers of the same url."""
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._markdown: str | None = None
+        self._error: BaseException | None = None
+
+    def set_result(self, markdown: str) -> None:
+        self._markdown = markdown
+        self._done.set()
+
+    def set_exception(self, error: BaseException) -> None:
+        self._error = error
+        self._done.set()
+
+    def result(self) -> str:
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._markdown
+
+
+# Crawls currently in progress, keyed by url. Concurrent tool calls for the
+# same url wait on the first caller's crawl instead of crawling it again.
+_inflight_crawls: dict[str, _InflightCrawl] = {}
+_inflight_lock = threading.Lock()
+
+
+def _crawl_markdown(url: str) -> str:
+    """Crawl a url and return its markdown, sharing in-flight crawls of the same url."""
+    with _inflight_lock:
+        inflight = _inflight_crawls.get(url)
+        is_owner = inflight is None
+        if is_owner:
+            inflight = _InflightCrawl()
+            _inflight_crawls[url] = inflight
+
+    if not is_owner:
+        return inflight.result()
+
+    try:
+        crawler = Crawler()
+        article = crawler.crawl(url)
+        markdown = article.to_markdown()
+        inflight.set_result(markdown)
+        return markdown
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_crawls.pop(url, None)
+
+
+def _get_explicit_scheme(url: str) -> str | None:
+    """Return the lower-cased scheme the url starts with, or None for a bare host."""
+    scheme, sep, rest = url.partition(":")
+    if not sep or not scheme or not scheme[0].isalpha():
+        return None
+    # Dots, slashes or query characters before the first colon mean a host or
+    # path, e.g. "example.com:8080" or "web.archive.org/web/2024/https://..."
+    if not all(c.isalnum() or c in "+-" for c in scheme):
+        return None
+    # "localhost:3000/path" is a host and port, not a scheme
+    if rest[:1].isdigit():
+        return None
+    return scheme.lower()
+
 
 @tool
 @log_io
@@ -19,9 +92,18 @@ def crawl_tool(
 ) -> str:
     """Use this to crawl a url and get a readable content in markdown format."""
     try:
-        crawler = Crawler()
-        article = crawler.crawl(url)
-        return {"url": url, "crawled_content": article.to_markdown()[:1000]}
+        # Scheme-less hosts such as "example.com/page" are accepted by Jina's
+        # reader, so only urls with an explicit non-http(s) scheme are rejected.
+        scheme = _get_explicit_scheme(url)
+        if scheme is not None and scheme not in _ALLOWED_URL_SCHEMES:
+            error_msg = (
+                f"Failed to crawl. Error: unsupported url {url!r}, "
+                "only http(s) urls can be crawled."
+            )
+            logger.error(error_msg)
+            return error_msg
+        markdown = _crawl_markdown(url)
+        return {"url": url, "crawled_content": markdown[:1000]}
     except BaseException as e:
         error_msg = f"Failed to crawl. Error: {repr(e)}"
         logger.error(error_msg)
@@ -23,18 +23,23 @@ def log_io(func: Callable) -> Callable:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Log input parameters
         func_name = func.__name__
-        params = ", ".join(
-            [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
-        )
-        logger.info(f"Tool {func_name} called with parameters: {params}")
+        # Skip formatting potentially large parameters and results when INFO is off
+        log_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Log input parameters
+        if log_enabled:
+            params = ", ".join(
+                [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
+            )
+            logger.info(f"Tool {func_name} called with parameters: {params}")
 
         # Execute the function
         result = func(*args, **kwargs)
 
         # Log the output
-        logger.info(f"Tool {func_name} returned: {result}")
+        if log_enabled:
+            logger.info(f"Tool {func_name} returned: {result}")
 
         return result
 
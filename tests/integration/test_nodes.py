@@ -922,6 +922,30 @@ async def test_execute_agent_step_basic(mock_state_with_steps, mock_agent):
         )
 
 
+@pytest.mark.asyncio
+async def test_execute_agent_step_includes_completed_steps(mock_state_with_steps):
+    # Should pass the findings of completed steps to the agent
+    captured = {}
+
+    async def ainvoke(input, config):
+        captured["input"] = input
+        return {"messages": [MagicMock(content="result content")]}
+
+    agent = MagicMock()
+    agent.ainvoke = ainvoke
+    with patch(
+        "src.graph.nodes.HumanMessage",
+        side_effect=lambda content, name=None: MagicMock(content=content, name=name),
+    ):
+        await _execute_agent_step(mock_state_with_steps, agent, "coder")
+    content = captured["input"]["messages"][0].content
+    assert (
+        "# Completed Research Steps\n\n"
+        "## Completed Step 1: Step 0\n\n<finding>\nDone\n</finding>\n\n"
+        "# Current Step"
+    ) in content
+
+
 @pytest.mark.asyncio
 async def test_execute_agent_step_no_unexecuted_step(
     mock_state_no_unexecuted, mock_agent
@@ -976,7 +1000,7 @@ async def test_execute_agent_step_recursion_limit_env(
     # Should respect AGENT_RECURSION_LIMIT env variable if set and valid
     monkeypatch.setenv("AGENT_RECURSION_LIMIT", "42")
     with (
-        patch("src.graph.nodes.logger") as mock_logger,
+        patch("src.config.configuration.logger") as mock_logger,
         patch(
             "src.graph.nodes.HumanMessage",
             side_effect=lambda content, name=None: MagicMock(
@@ -996,7 +1020,7 @@ async def test_execute_agent_step_recursion_limit_env_invalid(
     # Should fallback to default if env variable is invalid
     monkeypatch.setenv("AGENT_RECURSION_LIMIT", "notanint")
     with (
-        patch("src.graph.nodes.logger") as mock_logger,
+        patch("src.config.configuration.logger") as mock_logger,
         patch(
             "src.graph.nodes.HumanMessage",
             side_effect=lambda content, name=None: MagicMock(
@@ -1018,7 +1042,7 @@ async def test_execute_agent_step_recursion_limit_env_negative(
     # Should fallback to default if env variable is negative or zero
     monkeypatch.setenv("AGENT_RECURSION_LIMIT", "-5")
     with (
-        patch("src.graph.nodes.logger") as mock_logger,
+        patch("src.config.configuration.logger") as mock_logger,
         patch(
             "src.graph.nodes.HumanMessage",
             side_effect=lambda content, name=None: MagicMock(
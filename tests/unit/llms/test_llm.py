@@ -84,3 +84,26 @@ def test_get_llm_by_type_caches(monkeypatch, dummy_conf):
     inst2 = llm.get_llm_by_type("basic")
     assert inst1 is inst2
     assert called["called"]
+
+
+def test_get_llm_by_type_recreates_on_conf_change(monkeypatch, dummy_conf):
+    monkeypatch.delenv("BASIC_MODEL__API_KEY", raising=False)
+    monkeypatch.delenv("BASIC_MODEL__BASE_URL", raising=False)
+    monkeypatch.delenv("BASIC_MODEL__MODEL", raising=False)
+    current_conf = {"conf": dummy_conf}
+    monkeypatch.setattr(llm, "load_yaml_config", lambda path: current_conf["conf"])
+    llm._llm_cache.clear()
+
+    inst1 = llm.get_llm_by_type("basic")
+    # An equal config reloaded from disk keeps the cached instance
+    current_conf["conf"] = {k: dict(v) for k, v in dummy_conf.items()}
+    assert llm.get_llm_by_type("basic") is inst1
+
+    # A changed config creates a new instance from the new settings
+    current_conf["conf"] = {
+        **dummy_conf,
+        "BASIC_MODEL": {"api_key": "new_key", "base_url": "http://new"},
+    }
+    inst2 = llm.get_llm_by_type("basic")
+    assert inst2 is not inst1
+    assert inst2.kwargs["api_key"] == "new_key"
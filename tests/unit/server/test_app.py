@@ -3,7 +3,7 @@
 
 import base64
 import os
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
@@ -45,6 +45,15 @@ class TestMakeEvent:
         )
         assert result == expected
 
+    def test_make_event_keeps_non_ascii(self):
+        event_type = "message_chunk"
+        data = {"content": "你好", "role": "assistant"}
+        result = _make_event(event_type, data)
+        expected = (
+            'event: message_chunk\ndata: {"content": "你好", "role": "assistant"}\n\n'
+        )
+        assert result == expected
+
 
 class TestTTSEndpoint:
     @patch.dict(
@@ -163,6 +172,26 @@ class TestPodcastEndpoint:
         assert response.headers["content-type"] == "audio/mp3"
         assert response.content == b"fake_audio_data"
 
+    @patch("src.server.app.build_podcast_graph")
+    def test_generate_podcast_runs_workflow_in_thread(self, mock_build_graph, client):
+        mock_workflow = MagicMock()
+        mock_build_graph.return_value = mock_workflow
+        mock_workflow.invoke.return_value = {"output": b"fake_audio_data"}
+
+        with patch(
+            "src.server.app.asyncio.to_thread",
+            new_callable=AsyncMock,
+            side_effect=lambda func, *args, **kwargs: func(*args, **kwargs),
+        ) as mock_to_thread:
+            response = client.post(
+                "/api/podcast/generate", json={"content": "Test content"}
+            )
+
+        assert response.status_code == 200
+        mock_to_thread.assert_awaited_once_with(
+            mock_workflow.invoke, {"input": "Test content"}
+        )
+
     @patch("src.server.app.build_podcast_graph")
     def test_generate_podcast_error(self, mock_build_graph, client):
         mock_build_graph.side_effect = Exception("Podcast generation failed")
@@ -375,6 +404,22 @@ class TestRAGEndpoints:
         assert response.status_code == 200
         assert len(response.json()["resources"]) == 1
 
+    @patch("src.server.app.build_retriever")
+    def test_rag_resources_lists_in_thread(self, mock_build_retriever, client):
+        mock_retriever = MagicMock()
+        mock_retriever.list_resources.return_value = []
+        mock_build_retriever.return_value = mock_retriever
+
+        with patch(
+            "src.server.app.asyncio.to_thread",
+            new_callable=AsyncMock,
+            side_effect=lambda func, *args, **kwargs: func(*args, **kwargs),
+        ) as mock_to_thread:
+            response = client.get("/api/rag/resources?query=test")
+
+        assert response.status_code == 200
+        mock_to_thread.assert_awaited_once_with(mock_retriever.list_resources, "test")
+
     @patch("src.server.app.build_retriever")
     def test_rag_resources_without_retriever(self, mock_build_retriever, client):
         mock_build_retriever.return_value = None
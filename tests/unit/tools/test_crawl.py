@@ -1,5 +1,8 @@
+import threading
 from unittest.mock import Mock, patch
-from src.tools.crawl import crawl_tool
+
+import pytest
+from src.tools.crawl import _InflightCrawl, crawl_tool
 
 
 class TestCrawlTool:
@@ -107,3 +110,124 @@ class TestCrawlTool:
         assert "Failed to crawl" in result
         assert "Markdown conversion error" in result
         mock_logger.error.assert_called_once()
+
+    @patch("src.tools.crawl.Crawler")
+    def test_crawl_tool_shares_inflight_crawl(self, mock_crawler_class):
+        # Arrange
+        url = "https://example.com"
+        crawl_started = threading.Event()
+        second_caller_waiting = threading.Event()
+        release_crawl = threading.Event()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "Shared content"
+
+        def slow_crawl(_):
+            crawl_started.set()
+            release_crawl.wait(timeout=5)
+            return mock_article
+
+        mock_crawler = Mock()
+        mock_crawler.crawl.side_effect = slow_crawl
+        mock_crawler_class.return_value = mock_crawler
+
+        wait_for_result = _InflightCrawl.result
+
+        def signal_and_wait(inflight):
+            second_caller_waiting.set()
+            return wait_for_result(inflight)
+
+        # Act
+        results = []
+        with patch.object(_InflightCrawl, "result", signal_and_wait):
+            first = threading.Thread(target=lambda: results.append(crawl_tool(url)))
+            first.start()
+            assert crawl_started.wait(timeout=5)
+            second = threading.Thread(target=lambda: results.append(crawl_tool(url)))
+            second.start()
+            # Only finish the first crawl once the second caller has joined it
+            assert second_caller_waiting.wait(timeout=5)
+            release_crawl.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+
+        # Assert
+        assert len(results) == 2
+        assert all(r["crawled_content"] == "Shared content" for r in results)
+        mock_crawler.crawl.assert_called_once_with(url)
+
+    @patch("src.tools.crawl.Crawler")
+    @patch("src.tools.crawl.logger")
+    def test_crawl_tool_rejects_unsupported_scheme(
+        self, mock_logger, mock_crawler_class
+    ):
+        # Act
+        result = crawl_tool("file:///etc/passwd")
+
+        # Assert
+        assert isinstance(result, str)
+        assert "Failed to crawl" in result
+        assert "unsupported url" in result
+        mock_crawler_class.assert_not_called()
+        mock_logger.error.assert_called_once()
+
+    @patch("src.tools.crawl.Crawler")
+    def test_crawl_tool_accepts_bare_host(self, mock_crawler_class):
+        # Arrange
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "Bare host content"
+        mock_crawler.crawl.return_value = mock_article
+        mock_crawler_class.return_value = mock_crawler
+
+        url = "www.example.com/page"
+
+        # Act
+        result = crawl_tool(url)
+
+        # Assert
+        assert isinstance(result, dict)
+        assert result["crawled_content"] == "Bare host content"
+        mock_crawler.crawl.assert_called_once_with(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "web.archive.org/web/2024/https://example.com/a",
+            "example.com/redirect?to=https://x.org",
+            "example.com:8080/page",
+            "localhost:3000/page",
+        ],
+    )
+    @patch("src.tools.crawl.Crawler")
+    def test_crawl_tool_accepts_scheme_less_urls(self, mock_crawler_class, url):
+        # Arrange
+        mock_crawler = Mock()
+        mock_article = Mock()
+        mock_article.to_markdown.return_value = "Page content"
+        mock_crawler.crawl.return_value = mock_article
+        mock_crawler_class.return_value = mock_crawler
+
+        # Act
+        result = crawl_tool(url)
+
+        # Assert
+        assert isinstance(result, dict)
+        mock_crawler.crawl.assert_called_once_with(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "javascript:alert(1)",
+            "mailto:someone@example.com",
+            "data:text/html,<p>hi</p>",
+        ],
+    )
+    @patch("src.tools.crawl.Crawler")
+    def test_crawl_tool_rejects_schemes_without_slashes(self, mock_crawler_class, url):
+        # Act
+        result = crawl_tool(url)
+
+        # Assert
+        assert isinstance(result, str)
+        assert "unsupported url" in result
+        mock_crawler_class.assert_not_called()
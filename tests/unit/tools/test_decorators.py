@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 
 from unittest.mock import Mock, call, patch
-from src.tools.decorators import create_logged_tool
+import logging
+
+from src.tools.decorators import create_logged_tool, log_io
 
 
 class MockBaseTool:
@@ -117,3 +119,43 @@ class TestLoggedToolMixin:
             call_args = mock_debug.call_args[0][0]
             assert "Tool MockBaseTool returned:" in call_args
             assert "LoggedMockBaseTool" not in call_args
+
+
+class TestLogIo:
+
+    def test_log_io_logs_parameters_and_result(self):
+        """Test that log_io logs the call and the result at info level."""
+
+        @log_io
+        def sample_tool(value, flag=False):
+            return f"{value}-{flag}"
+
+        with patch("src.tools.decorators.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = True
+            result = sample_tool("abc", flag=True)
+
+        assert result == "abc-True"
+        mock_logger.info.assert_has_calls(
+            [
+                call("Tool sample_tool called with parameters: abc, flag=True"),
+                call("Tool sample_tool returned: abc-True"),
+            ]
+        )
+
+    def test_log_io_skips_formatting_when_info_disabled(self):
+        """Test that log_io does not stringify arguments when INFO is disabled."""
+        argument = Mock()
+        argument.__str__ = Mock(return_value="argument")
+
+        @log_io
+        def sample_tool(value):
+            return "done"
+
+        with patch("src.tools.decorators.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = sample_tool(argument)
+
+        assert result == "done"
+        mock_logger.isEnabledFor.assert_called_once_with(logging.INFO)
+        mock_logger.info.assert_not_called()
+        argument.__str__.assert_not_called()